@@ -335,15 +335,16 @@ configuration and then, if present, the corresponding subdirectory configuration
             raise ConfigurationError("specified path doesn't exist", path)
         elif os.path.isfile(path):
             path = os.path.dirname(path)
-        conf_path = os.path.abspath(os.path.join(path, CONF_FILE_NAME))
-        if conf_path in self._instances.keys():
-            return self._instances[conf_path]
-        else:
-            # check directory above if in a subdirectory of a lecture
-            if not os.path.exists(conf_path) and not common.is_lecture_root(path):
-                dir_above = os.path.split(os.path.abspath(path))[0]
-                if common.is_lecture_root(dir_above):
-                    conf_path = os.path.join(dir_above, CONF_FILE_NAME)
+        requested_path = os.path.abspath(os.path.join(path, CONF_FILE_NAME))
+        if requested_path in self._instances:
+            return self._instances[requested_path]
+        conf_path = requested_path
+        # check directory above if in a subdirectory of a lecture
+        if not os.path.exists(conf_path) and not common.is_lecture_root(path):
+            dir_above = os.path.split(os.path.abspath(path))[0]
+            if common.is_lecture_root(dir_above):
+                conf_path = os.path.join(dir_above, CONF_FILE_NAME)
+        if conf_path not in self._instances:
             try:
                 self._instances[conf_path] = LectureMetaData(conf_path)
                 if os.path.exists(conf_path):
@@ -354,6 +355,9 @@ configuration and then, if present, the corresponding subdirectory configuration
                 raise ConfigurationError(
                     _("Configuration errorneous: ") + str(e), conf_path, e.position[0],
                 )
+        # remember where the configuration of a subdirectory was found, so
+        # that the lecture root isn't searched again
+        self._instances[requested_path] = self._instances[conf_path]
         return self._instances[conf_path]
 
     def get_conf_instance_safe(self, path):
@@ -14,6 +14,8 @@ from . import errors
 from . import roman
 
 CHAPTERNUM = re.compile(r"^[a-z|A-Z]+(\d\d).*\.md")
+# file name of a chapter, the first two digits are the chapter number
+CHAPTER_FILE_NAME = re.compile(r"^[a-z|A-Z]+(\d\d)\d*\.md$")
 HEADING_ATTRIBUTES = re.compile("^(#\w+\s*|\.\w+\s*|\w+=\w+\s*)+$")
 
 
@@ -43,9 +45,8 @@ used for generation and the text itself is ignored."""
         # which are going to be ignored)
         last_processed_char = char
     # strip hyphens at the beginning, as well as numbers
-    while res_id and not res_id[0].isalpha():
-        res_id.pop(0)
-    return "".join(res_id)
+    start = next((i for i, c in enumerate(res_id) if c.isalpha()), len(res_id))
+    return "".join(res_id[start:])
 
 
 def get_encoding():
@@ -88,7 +89,7 @@ def is_attributes(text):
     representation of attribute. """
     if text == "-":
         return True  # shortcut for unnumbered given by pandoc
-    return re.match(HEADING_ATTRIBUTES, text)
+    return HEADING_ATTRIBUTES.match(text)
 
 
 def extract_label_and_attributes(text):
@@ -224,12 +225,12 @@ def extract_chapter_number(path):
     The path is optional, only the file name is required, but as shown above
     both is fine. If the file name does not follow naming conventions, a
     StructuralError is raised."""
-    match = re.search(r"^(?:[a-z|A-Z]+)(\d+)\.md$", os.path.basename(path))
-    if not match or len(match.groups()[0]) < 2:
+    match = CHAPTER_FILE_NAME.search(os.path.basename(path))
+    if not match:
         raise errors.StructuralError(
             _("the file does not follow naming " "conventions"), path
         )
-    return int(match.groups()[0][:2])
+    return int(match.group(1))
 
 
 class FileHeading(Heading):
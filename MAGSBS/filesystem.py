@@ -27,14 +27,14 @@ Files picked up: ending on configured file endings."""
             raise errors.StructuralError("Directory not found", path)
         self.path = path
         self.black_list = ["quell", ".svn", ".git", "bilder", "images"]
-        self.endings = ["md"]
+        self.endings = ("md",)
         self.exclude_non_chapter_prefixed = True
 
     def add_blacklisted(self, new):
         self.black_list += new
 
     def set_endings(self, endings):
-        self.endings = [(e[1:] if e.startswith(".") else e) for e in endings]
+        self.endings = tuple((e[1:] if e.startswith(".") else e) for e in endings)
 
     def set_ignore_non_chapter_prefixed(self, x):
         """Ignore files and directories which do not adhere to the common
@@ -51,10 +51,7 @@ Files picked up: ending on configured file endings."""
 
     def interesting_file(self, fn):
         """Filter against file endings."""
-        for ending in self.endings:
-            if fn.lower().endswith(ending):
-                return True
-        return False
+        return fn.lower().endswith(self.endings)
 
     def walk(self):
         if os.path.isfile(self.path):
@@ -64,21 +61,27 @@ Files picked up: ending on configured file endings."""
             return [(path, [], [file])]
         res = []
         dirs = [self.path]
+        # skip those which aren't starting with a common chapter prefix
+        is_wanted = (
+            is_valid_file if self.exclude_non_chapter_prefixed else lambda _p: True
+        )
         for dir in dirs:
-            if dir == ".":
-                items = os.listdir(dir)
-            else:
-                items = [os.path.join(dir, e) for e in os.listdir(dir)]
-            files = sorted(
-                [e for e in items if os.path.isfile(e) and self.interesting_file(e)]
-            )
-            newdirs = sorted(
-                [e for e in items if os.path.isdir(e) and self.interesting_dir(e)]
-            )
-            if self.exclude_non_chapter_prefixed:
-                # remove those which aren't starting with a common chapter prefix
-                files = [e for e in files if is_valid_file(e)]
-                newdirs = [e for e in newdirs if is_valid_file(e)]
+            files = []
+            newdirs = []
+            # DirEntry caches the file type from the directory listing, which
+            # saves a stat call per entry
+            with os.scandir(dir) as entries:
+                for entry in entries:
+                    path = entry.name if dir == "." else entry.path
+                    if not is_wanted(path):
+                        continue
+                    if entry.is_file():
+                        if self.interesting_file(path):
+                            files.append(path)
+                    elif entry.is_dir() and self.interesting_dir(path):
+                        newdirs.append(path)
+            files.sort()
+            newdirs.sort()
             dirs += newdirs
             res.append(
                 (
@@ -26,7 +26,7 @@ lectures containing e.g. lecture and exercise material.  For each root the
 navigation bar and the table of contents is generated; afterwards all MarkDown
 files are converted."""
 
-    def __init__(self, path, profile, output_format):
+    def __init__(self, path, profile, output_format, jobs=None):
         if os.path.exists(path):
             if os.path.isfile(path):
                 raise OSError("Operation can only be applied to directories.")
@@ -41,6 +41,7 @@ files are converted."""
         self._roots = self.__findroot(path)
         self._profile = profile
         self._output_format = output_format
+        self._jobs = jobs
 
     def get_roots(self):
         return self._roots
@@ -50,17 +51,14 @@ files are converted."""
         dirs = [path]
         go_deeper = True
         for directory in dirs:
-            meta = [e for e in os.listdir(directory) if e == config.CONF_FILE_NAME]
-            if meta:  # found, this is our root
-                roots.append(directory)
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+            if any(e.name == config.CONF_FILE_NAME for e in entries):
+                roots.append(directory)  # found, this is our root
                 go_deeper = False
             else:
                 if go_deeper:
-                    dirs += [
-                        os.path.join(directory, e)
-                        for e in os.listdir(directory)
-                        if os.path.isdir(os.path.join(directory, e))
-                    ]
+                    dirs += [e.path for e in entries if e.is_dir()]
         found_md = any(
             fname.endswith(".md")
             for directory, _, flist in os.walk(path)
@@ -111,7 +109,7 @@ files are converted."""
                         index = c.get_index()
                         md_creator = toc.TocFormatter(index, ".")
                         with open("inhalt.md", "w", encoding="utf-8") as file:
-                            file.write(md_creator.format())
+                            file.writelines(md_creator.iter_format())
 
             conv = pandoc.converter.Pandoc(root_path=orig_cwd)
             files_to_convert = [
@@ -121,5 +119,6 @@ files are converted."""
             ]
             conv.set_conversion_profile(self._profile)
             conv.set_output_format(self._output_format)
+            conv.set_jobs(self._jobs)
             conv.convert_files(files_to_convert)
             os.chdir(orig_cwd)
@@ -11,10 +11,10 @@
 # pylint: disable=multiple-imports
 
 
+import functools
 import os
 import shutil
 import sys
-import textwrap
 import MAGSBS
 
 try:
@@ -27,46 +27,26 @@ except (SystemError, ModuleNotFoundError):
         from MAGSBS import matuc_impl
 
 
+@functools.lru_cache(maxsize=1)
 def get_terminal_size():
-    """Get terminal size on GNU/Linux, default to 80 x 25 if not detectable."""
-    # pylint: disable=bare-except,multiple-imports
-    env = os.environ
+    """Get terminal size as (columns, lines), default to 80 x 25 if not
+    detectable. The size is only determined once per process."""
+    return tuple(shutil.get_terminal_size((80, 25)))
 
-    def ioctl_GWINSZ(fd):
-        try:
-            import fcntl, termios, struct
-
-            cr = struct.unpack("hh", fcntl.ioctl(fd, termios.TIOCGWINSZ, "1234"))
-        except:
-            return
-        return cr
-
-    cr = ioctl_GWINSZ(0) or ioctl_GWINSZ(1) or ioctl_GWINSZ(2)
-    if not cr:
-        try:
-            fd = os.open(os.ctermid(), os.O_RDONLY)
-            cr = ioctl_GWINSZ(fd)
-            os.close(fd)
-        except:
-            pass
-        if not cr:
-            cr = (env.get("LINES", 25), env.get("COLUMNS", 80))
-    return int(cr[1]), int(cr[0])
 
-
-def flatten(thing):  # flatten a list of lists
-    if isinstance(thing, list):
-        for item in thing:
-            for whatever in flatten(item):
-                yield whatever
-    else:
-        yield thing
+@functools.lru_cache(maxsize=1)
+def get_clear_command():
+    """Return the command to clear the screen or None, if none was found. The
+    PATH is only searched once per process."""
+    if sys.platform.startswith("win"):
+        return "cmd /c cls"
+    return "clear" if shutil.which("clear") else None
 
 
 class TextFormatter(matuc_impl.OutputFormatter):
     def __init__(self):
         super().__init__()
-        self.spaces = lambda num: " " * num
+        self.__wrapper = None  # created on first use, see _format_indented_line
 
     def __emit_warnings(self):
         """Emit warnings from the warning registry."""
@@ -90,50 +70,61 @@ class TextFormatter(matuc_impl.OutputFormatter):
             line = str(line)
         prefix = " " * indent + prefix
         indent = indent + 2  # indent subsequent lines with indent + 2
-        t = textwrap.TextWrapper(
-            width=get_terminal_size()[0] - indent, initial_indent=prefix
-        )
-        lines = t.wrap(line)
+        width = get_terminal_size()[0] - indent
+        # short values without special white space are returned as they are,
+        # wrapping would not change them
+        if (
+            len(prefix) + len(line) <= width
+            and line.isprintable()
+            and line == line.strip()
+        ):
+            return [prefix + line]
+        # one wrapper is reused for all lines, only its width and prefix change
+        if self.__wrapper is None:
+            import textwrap
+
+            self.__wrapper = textwrap.TextWrapper()
+        self.__wrapper.width = width
+        self.__wrapper.initial_indent = prefix
+        lines = self.__wrapper.wrap(line)
         return [lines[0]] + ["\n{}{}".format(" " * indent, l) for l in lines[1:]]
 
-    def format_recursive(self, obj, indent):
+    def format_recursive(self, obj, indent, out):
         """Format a JSON-alike structure (dicts and lists containing dicts,
         lists, strings or integers) to a nice and structured text
-        version."""
+        version. The text chunks are appended to the list `out`."""
         if not obj:
-            return []
+            return
         elif isinstance(obj, (str, bool, float, int)):
-            return self._format_indented_line(obj, "", indent) + ["\n"]
-        elif isinstance(obj, (list, tuple)):  # format head of list, then tail
-            # avoid too deep recursion (is there a nicer solution?)
-            data = []
+            out.extend(self._format_indented_line(obj, "", indent))
+            out.append("\n")
+        elif isinstance(obj, (list, tuple)):
             for item in obj:
-                data.append(self.format_recursive(item, indent))
-            return data
+                self.format_recursive(item, indent, out)
         elif isinstance(obj, dict):
             if "verbatim" in obj:  # do not format verbatim strings
-                return [
-                    " " * indent,  # reindent, but keep verbatim otherwise:
-                    ("\n" + " " * indent).join(obj["verbatim"].split("\n")),
-                    "\n",
-                ]
-            data = []
+                out.append(" " * indent)  # reindent, but keep verbatim otherwise:
+                out.append(("\n" + " " * indent).join(obj["verbatim"].split("\n")))
+                out.append("\n")
+                return
             for key, value in obj.items():
                 # no line break, display as key: value
                 if isinstance(value, (str, int, bool, float)):
-                    data += self._format_indented_line(
-                        str(value), key + ": ", indent
-                    ) + ["\n"]
+                    out.extend(
+                        self._format_indented_line(str(value), key + ": ", indent)
+                    )
+                    out.append("\n")
                 else:  # format key + \n + value (recursive)
-                    data += [" " * (indent), key, ":", "\n"]
-                    data += self.format_recursive(value, indent + 2)
-            return data
+                    out.extend((" " * indent, key, ":", "\n"))
+                    self.format_recursive(value, indent + 2, out)
 
     def emit_result(self, result):
         self.__emit_warnings()
-        text = "".join(flatten(self.format_recursive(result, 0)))
+        out = []
+        self.format_recursive(result, 0, out)
+        text = "".join(out).rstrip() + "\n"
         try:
-            print(text.rstrip())
+            sys.stdout.write(text)
         except UnicodeEncodeError as e:
             print("Error while printing non-ascii text: %s\n" % str(e))
             print(text.encode("ascii", errors="ignore"))
@@ -145,7 +136,9 @@ class TextFormatter(matuc_impl.OutputFormatter):
             message = error.pop("message")
             error["message"] = {"verbatim": message}
         error = {"error": error}
-        sys.stderr.write("".join(flatten(self.format_recursive(error, 0))) + "\n")
+        out = []
+        self.format_recursive(error, 0, out)
+        sys.stderr.write("".join(out) + "\n")
 
     def emit_usage(self, usage, error=None):
         if error:
@@ -157,10 +150,9 @@ class TextFormatter(matuc_impl.OutputFormatter):
     def clear(self):
         """Clear the screen. There is no easy cross-platform way, so try to use
         cls/clear."""
-        if sys.platform.startswith("win"):
-            os.system("cmd /c cls")
-        elif shutil.which("clear"):
-            os.system("clear")
+        command = get_clear_command()
+        if command:
+            os.system(command)
         else:
             print("\n" + "-" * get_terminal_size()[0])
             if "linux" in sys.platform:
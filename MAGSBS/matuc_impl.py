@@ -20,47 +20,34 @@ import collections
 import io
 import os
 import sys
-import textwrap
 
 import MAGSBS.common
-import MAGSBS.config
-import MAGSBS.datastructures
 import MAGSBS.errors
-import MAGSBS.factories
-import MAGSBS.filesystem
-import MAGSBS.master
-import MAGSBS.mparser
-from MAGSBS import pagenumbering
-import MAGSBS.pandoc
-import MAGSBS.quality_assurance
-import MAGSBS.toc
 
 PROCNAME = os.path.basename(sys.argv[0])
 
 # necessary for function '_'
 MAGSBS.common.setup_i18n()
 
-MAIN_USAGE = _(
-    """%s <command> <options>
+
+def get_usage():
+    """Return the translated program usage, built only when it is printed. The
+    command overview is generated from main.HANDLERS."""
+    commands = "\n".join(
+        "{:<16}- {}".format(name, description)
+        for name, (_handler, description) in main.HANDLERS.items()
+    )
+    usage = _(
+        """%s <command> <options>
 
 <command> determines which action to take. The syntax might vary between
 commands. Use %s <command> -h for help.
 
 Available commands are:
 
-addpnum         - generate new page number, relative to its predecessors
-conf            - set, init or update a configuration
-conv            - convert a project
-fixpnums        - fix incorrect page numbering of a document
-imgdsc          - generate image description (snippets)
-iswithinlecture - test, whether a certain path is part of a project
-new             - create new project structure
-mk              - invoke "mistkerl", a quality assurance helper
-toc             - generate table of contents
-version         - output program version
 """
-    % (PROCNAME, PROCNAME)
-)
+    )
+    return usage % (PROCNAME, PROCNAME) + commands + "\n"
 
 
 class OutputFormatter:
@@ -181,19 +168,20 @@ class main:
         self.output_formatter = output_formatter
 
     def run(self, args):
-        if len(args) < 2:
-            self.output_formatter.emit_usage(MAIN_USAGE)
+        # no configuration is read before a handler asks for it, so printing
+        # the usage or the version never touches the file system
+        if len(args) < 2 or args[1] in ("-h", "--help"):
+            self.output_formatter.emit_usage(get_usage())
         else:
-            # try to get a handler for it
-            try:
-                invokation_command = "%s %s" % (PROCNAME, sys.argv[1])
-                func = getattr(self, "handle_%s" % args[1])
-            except AttributeError:
+            command = self.HANDLERS.get(args[1])
+            if not command:
                 self.output_formatter.emit_usage(
-                    MAIN_USAGE, _("Invalid command: %s" % args[1])
+                    get_usage(), _("Invalid command: %s" % args[1])
                 )
                 sys.exit(127)
-            ret = func(invokation_command, args[2:])
+            handler = command[0]
+            invokation_command = "%s %s" % (PROCNAME, args[1])
+            ret = handler(self, invokation_command, args[2:])
             if not ret:
                 ret = 0
             sys.exit(ret)
@@ -228,12 +216,14 @@ class main:
             )
             sys.exit(126)
 
+        from MAGSBS import toc
+
         with ErrorHandler(self.output_formatter):
-            idxer = MAGSBS.toc.HeadingIndexer(directory)
+            idxer = toc.HeadingIndexer(directory)
             idxer.walk()
             if not idxer.is_empty():
-                fmt = MAGSBS.toc.TocFormatter(idxer.get_index(), directory)
-                file.write(fmt.format())
+                fmt = toc.TocFormatter(idxer.get_index(), directory)
+                file.writelines(fmt.iter_format())
                 if isinstance(file, io.StringIO):
                     file.seek(0)
                     self.output_formatter.emit_result({"verbatim": file.read()})
@@ -242,8 +232,12 @@ class main:
 
     def handle_conf(self, cmd, args):
         """Create or update configuration."""
-        description = _(
-            """Allowed subcommands are `show`, `update` and `init`.
+        if args == ["show"]:
+            # nothing to parse, so the option parser is not built
+            subcmd, options = "show", None
+        else:
+            description = _(
+                """Allowed subcommands are `show`, `update` and `init`.
 `show` shows the current configuration settings, default values if none present.
 `update` and `show` try to find the correct configuration: if none exists in the
 current directory and you are in a subdirectory of a project, the project root
@@ -253,100 +247,107 @@ are displayed.
 `init` on the other hand behaves basically like update (it sets configuration
 values), but it does that for the current directory. This is handy for
 sub-directory configurations or initialization of a new project."""
-        )
-        parser = HelpfulParser(cmd, self.output_formatter, description)
-        parser.add_argument(
-            "-a",
-            dest="AppendixPrefix",
-            help=_(
-                'insert "A" as prefix for each chapter number in the '
-                'appendix and omit the header "appendix"'
-            ),
-            action="store_true",
-            default=False,
-        )
-        parser.add_argument(
-            "-A", dest="SourceAuthor", help=_("set author of source document")
-        )
-        parser.add_argument(
-            "-e",
-            dest="Editor",
-            help=_("set project editor"),
-            metavar="NAME",
-            default=None,
-        )
-        parser.add_argument(
-            "-i",
-            dest="Institution",
-            help=_("set institution (default TU Dresden)"),
-            metavar="NAME",
-            default=None,
-        )
-        parser.add_argument(
-            "-l",
-            dest="LectureTitle",
-            help=_("set title of project (first heading level 1 by " "default)"),
-            metavar="TITLE",
-            default=None,
-        )
-        parser.add_argument(
-            "-L",
-            dest="Language",
-            help=_("set document language (de by default)"),
-            default="de",
-        )
-        parser.add_argument(
-            "-p",
-            "--pnum-gap",
-            dest="PageNumberingGap",
-            help=_(
-                "specify gap between page numbering links in "
-                "navigation bar (default: 5)"
-            ),
-            metavar="NUM",
-            default=None,
-        )
-        parser.add_argument(
-            "-s",
-            dest="Source",
-            help=_("set information about source document"),
-            metavar="SRC",
-            default=None,
-        )
-        parser.add_argument(
-            "-S",
-            dest="SemesterOfEdit",
-            help=_("set semester of edit (will be guessed otherwise)"),
-            metavar="SEMYEAR",
-            default=None,
-        )
-        parser.add_argument(
-            "--toc-depth",
-            dest="TocDepth",
-            help=_("limit the heading depth for the table of contents"),
-            metavar="NUM",
-            default=None,
-        )
-        parser.add_argument(
-            "-w",
-            dest="WorkingGroup",
-            help=_("set working group"),
-            metavar="GROUP",
-            default=None,
-        )
+            )
+            parser = HelpfulParser(cmd, self.output_formatter, description)
+            # options not given on the command line are left out of the namespace,
+            # so that only settings passed by the user are changed
+            parser.add_argument(
+                "-a",
+                dest="AppendixPrefix",
+                help=_(
+                    'insert "A" as prefix for each chapter number in the '
+                    'appendix and omit the header "appendix"'
+                ),
+                action="store_true",
+                default=argparse.SUPPRESS,
+            )
+            parser.add_argument(
+                "-A",
+                dest="SourceAuthor",
+                help=_("set author of source document"),
+                default=argparse.SUPPRESS,
+            )
+            parser.add_argument(
+                "-e",
+                dest="Editor",
+                help=_("set project editor"),
+                metavar="NAME",
+                default=argparse.SUPPRESS,
+            )
+            parser.add_argument(
+                "-i",
+                dest="Institution",
+                help=_("set institution (default TU Dresden)"),
+                metavar="NAME",
+                default=argparse.SUPPRESS,
+            )
+            parser.add_argument(
+                "-l",
+                dest="LectureTitle",
+                help=_("set title of project (first heading level 1 by " "default)"),
+                metavar="TITLE",
+                default=argparse.SUPPRESS,
+            )
+            parser.add_argument(
+                "-L",
+                dest="Language",
+                help=_("set document language (de by default)"),
+                default=argparse.SUPPRESS,
+            )
+            parser.add_argument(
+                "-p",
+                "--pnum-gap",
+                dest="PageNumberingGap",
+                help=_(
+                    "specify gap between page numbering links in "
+                    "navigation bar (default: 5)"
+                ),
+                metavar="NUM",
+                default=argparse.SUPPRESS,
+            )
+            parser.add_argument(
+                "-s",
+                dest="Source",
+                help=_("set information about source document"),
+                metavar="SRC",
+                default=argparse.SUPPRESS,
+            )
+            parser.add_argument(
+                "-S",
+                dest="SemesterOfEdit",
+                help=_("set semester of edit (will be guessed otherwise)"),
+                metavar="SEMYEAR",
+                default=argparse.SUPPRESS,
+            )
+            parser.add_argument(
+                "--toc-depth",
+                dest="TocDepth",
+                help=_("limit the heading depth for the table of contents"),
+                metavar="NUM",
+                default=argparse.SUPPRESS,
+            )
+            parser.add_argument(
+                "-w",
+                dest="WorkingGroup",
+                help=_("set working group"),
+                metavar="GROUP",
+                default=argparse.SUPPRESS,
+            )
+
+            if not args or args[0] not in ["show", "update", "init"]:
+                parser.error(_("Error: no subcommand specified."))
+                sys.exit(88)
+            subcmd = args[0]
+            options = parser.parse_args(args[1:])
 
-        if not args or args[0] not in ["show", "update", "init"]:
-            parser.error(_("Error: no subcommand specified."))
-            sys.exit(88)
-        subcmd = args[0]
+        from MAGSBS import config
 
-        options = parser.parse_args(args[1:])
         if subcmd == "init":
             # read configuration from cwd, if present
-            inst = MAGSBS.config.LectureMetaData(MAGSBS.config.CONF_FILE_NAME)
+            inst = config.LectureMetaData(config.CONF_FILE_NAME)
             inst.write()
         else:
-            inst = MAGSBS.config.ConfFactory().get_conf_instance(os.getcwd())
+            inst = config.ConfFactory().get_conf_instance(os.getcwd())
             try:
                 inst.read()
             except FileNotFoundError:
@@ -360,16 +361,13 @@ sub-directory configurations or initialization of a new project."""
                     }
                 }
             )
-        elif subcmd in ("update", "init"):
-            for opt, value in options.__dict__.items():
-                if value is not None:
-                    inst[MAGSBS.config.MetaInfo[opt]] = value
+        else:  # update or init
+            for opt, value in vars(options).items():
+                inst[config.MetaInfo[opt]] = value
             self.output_formatter.emit_result(
                 {_("New settings"): {key.name: value for key, value in inst.items()}}
             )
             inst.write()
-        else:
-            parser.print_help()
 
     def handle_conv(self, cmd, args):
         """Convert files."""
@@ -386,21 +384,35 @@ sub-directory configurations or initialization of a new project."""
             metavar="FMT",
             default=None,
         )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            dest="jobs",
+            type=int,
+            help=_(
+                "number of directories to convert in parallel (default: number "
+                "of processors)"
+            ),
+            metavar="NUM",
+            default=None,
+        )
         parser.add_argument("path", help=_("path to input file or directory"))
         args = parser.parse_args(args)
+        if args.jobs is not None and args.jobs < 1:
+            parser.error(_("the number of jobs must be at least 1"))
         if not os.path.exists(args.path):
             self.output_formatter.emit_error(
                 _("file or directory not found: %s" % args.path)
             )
             sys.exit(127)
         with ErrorHandler(self.output_formatter):
-            if os.path.isdir(args.path):
-                from MAGSBS.pandoc.formats import (
-                    ConversionProfile,
-                    OutputFormat,
-                )
+            # Pandoc and its filters are only loaded by the commands using them
+            from MAGSBS.master import Master
+            from MAGSBS.pandoc.converter import Pandoc
+            from MAGSBS.pandoc.formats import ConversionProfile, OutputFormat
 
-                m = MAGSBS.master.Master(
+            if os.path.isdir(args.path):
+                m = Master(
                     args.path,
                     ConversionProfile.Blind,
                     (
@@ -408,10 +420,11 @@ sub-directory configurations or initialization of a new project."""
                         if not args.format
                         else OutputFormat.from_string(args.format)
                     ),
+                    jobs=args.jobs,
                 )
                 m.run()
             else:
-                p = MAGSBS.pandoc.converter.Pandoc(root_path=os.getcwd())
+                p = Pandoc(root_path=os.getcwd())
                 # do not handle format argument as only html is supported for
                 # convcerting a single file.
                 p.convert_files((args.path,))
@@ -455,7 +468,9 @@ sub-directory configurations or initialization of a new project."""
             desc = sys.stdin.read()
         else:
             desc = options.description
-        img = MAGSBS.factories.ImageDescription(options.path)
+        from MAGSBS import factories
+
+        img = factories.ImageDescription(options.path)
         img.set_description(desc)
         img.set_outsource_descriptions(options.outsource)
         if options.title:
@@ -496,7 +511,7 @@ sub-directory configurations or initialization of a new project."""
         parser.add_argument(
             "-a",
             dest="appendix_count",
-            default="0",
+            default=0,
             type=int,
             metavar="COUNT",
             help=_("number of appendix chapters (default 0)"),
@@ -504,7 +519,7 @@ sub-directory configurations or initialization of a new project."""
         parser.add_argument(
             "-c",
             dest="chapter_count",
-            default="2",
+            default=2,
             type=int,
             metavar="COUNT",
             help=_("number of chapters (default 2)"),
@@ -533,16 +548,12 @@ sub-directory configurations or initialization of a new project."""
         if not options.directory:
             parser.print_help()
             sys.exit(1)
-        try:
-            a = int(options.appendix_count)
-            c = int(options.chapter_count)
-        except ValueError:
-            self.output_formatter.emit_error(
-                _("The number of chapters and " "appendix chapters must be integers.")
-            )
-            sys.exit(125)
-        builder = MAGSBS.filesystem.InitLecture(options.directory, c, options.lang)
-        builder.set_amount_appendix_chapters(a)
+        from MAGSBS import filesystem
+
+        builder = filesystem.InitLecture(
+            options.directory, options.chapter_count, options.lang
+        )
+        builder.set_amount_appendix_chapters(options.appendix_count)
         if options.preface:
             builder.set_has_preface(True)
         if options.nochapter:
@@ -550,7 +561,10 @@ sub-directory configurations or initialization of a new project."""
         builder.generate_structure()
 
     def handle_mk(self, cmd, args):
-        description = textwrap.dedent(
+        import inspect
+
+        # cleandoc dedents like textwrap.dedent and keeps the translated msgid
+        description = inspect.cleandoc(
             _(
                 """
         Run "mistkerl", a quality assurance helper. It checks for common errors
@@ -595,7 +609,9 @@ sub-directory configurations or initialization of a new project."""
             sys.exit(5)
 
         def format_errors():
-            mistkerl = MAGSBS.quality_assurance.Mistkerl()
+            from MAGSBS.quality_assurance import Mistkerl
+
+            mistkerl = Mistkerl()
             mistakes = mistkerl.run(options.input)
             if not mistakes:
                 return _("No errors found. Hopefully there are none :-).")
@@ -699,6 +715,8 @@ sub-directory configurations or initialization of a new project."""
         except ValueError:
             self.output_formatter.emit_error(_("Argument 2 is not a number."))
             return 5
+        from MAGSBS import pagenumbering
+
         # try to read from stdin or from file if -f or -F; write to stdout or to
         # file if -F given
         if options.read_from_file or options.rw_from_file:
@@ -771,14 +789,16 @@ sub-directory configurations or initialization of a new project."""
         if options.file and not os.path.exists(options.file):
             self.output_formatter.emit_error(_("Given path has to exist."))
             sys.exit(74)
+        from MAGSBS import mparser, pagenumbering
+
         pnums = None
         if options.file:
-            pnums = MAGSBS.mparser.extract_page_numbers(options.file)
+            pnums = mparser.extract_page_numbers(options.file)
         else:
-            paragraphs = MAGSBS.mparser.file2paragraphs(sys.stdin.read())
-            pnums = MAGSBS.mparser.extract_page_numbers_from_par(paragraphs)
+            paragraphs = mparser.file2paragraphs(sys.stdin.read())
+            pnums = mparser.extract_page_numbers_from_par(paragraphs)
 
-        errorneous = MAGSBS.pagenumbering.check_page_numbering(pnums)
+        errorneous = pagenumbering.check_page_numbering(pnums)
         if not errorneous:
             self.output_formatter.emit_result([])
             sys.exit(0)
@@ -802,7 +822,30 @@ sub-directory configurations or initialization of a new project."""
 
     # pylint: disable=unused-argument
     def handle_version(self, dont, care):
-        self.output_formatter.emit_result({"version": str(MAGSBS.config.VERSION)})
+        from MAGSBS import config
+
+        self.output_formatter.emit_result({"version": str(config.VERSION)})
+
+    # command name -> (handler, description for the usage); only the handler
+    # of the invoked command builds a parser and imports its modules
+    HANDLERS = {
+        "addpnum": (
+            handle_addpnum,
+            _("generate new page number, relative to its predecessors"),
+        ),
+        "conf": (handle_conf, _("set, init or update a configuration")),
+        "conv": (handle_conv, _("convert a project")),
+        "fixpnums": (handle_fixpnums, _("fix incorrect page numbering of a document")),
+        "imgdsc": (handle_imgdsc, _("generate image description (snippets)")),
+        "iswithinlecture": (
+            handle_iswithinlecture,
+            _("test, whether a certain path is part of a project"),
+        ),
+        "mk": (handle_mk, _('invoke "mistkerl", a quality assurance helper')),
+        "new": (handle_new, _("create new project structure")),
+        "toc": (handle_toc, _("generate table of contents")),
+        "version": (handle_version, _("output program version")),
+    }
 
 
 def insert_line(lines, line_number, line):
@@ -113,7 +113,7 @@ def extract_page_numbers(path, ignore_after_lnum=-1):
     Returned is a list of page numbers. See extract_page_numbers_from_string for
     the actual format."""
     with open(path, "r", encoding="utf-8") as f:
-        paragraphs = file2paragraphs(f.read())
+        paragraphs = file2paragraphs(f)
         return extract_page_numbers_from_par(
             paragraphs, ignore_after_lnum=ignore_after_lnum
         )
@@ -144,7 +144,6 @@ def extract_page_numbers_from_par(
         if len(p) == 1 and p[0].startswith("||") and l <= ignore_after_lnum
     )
 
-    paragraphs = list(paragraphs)
     for start_line, par in paragraphs:
         try:
             pnum = pnum_from_str(par[0], regex)
@@ -176,9 +175,9 @@ def pnum_from_str(str, regex=config.PAGENUMBERING_PATTERN):
     is_uppercase = True
     page_numbers = []
     for number in filter(lambda n: n is not None, numbers):
-        try:
+        if number.isdecimal():
             number = int(number)
-        except ValueError:  # try roman number
+        else:  # try roman number
             is_uppercase = not number.islower()    # Prefer upper case.
             try:
                 number = roman.from_roman(number.upper())
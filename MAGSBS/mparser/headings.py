@@ -15,13 +15,9 @@ def parse_hashed_headings(text):
     Example:
     >>>> parse_hashed_headings("### foo bar")
     (3, 'foo bar')"""
-    level = 0
-    while text.startswith("#"):
-        level += 1
-        text = text[1:]
-    while text.endswith("#"):
-        text = text[:-1]
-    text = text.lstrip().rstrip()
+    stripped = text.lstrip("#")
+    level = len(text) - len(stripped)
+    text = stripped.rstrip("#").strip()
     return (text, level)
 
 
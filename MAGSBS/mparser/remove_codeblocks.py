@@ -5,6 +5,8 @@ import enum
 from itertools import chain
 import re
 
+INLINE_CODE = re.compile("`.*?`")
+
 
 def all_lines_indented(lines):
     """An indented code block must indent all lines (except for empty ones) with
@@ -41,7 +43,7 @@ def rm_codeblocks(paragraphs):
             else:  # try to replace `inline`-environments
                 for index, line in enumerate(par):
                     if "`" in line and is_even(line.count("`")):
-                        par[index] = re.sub("`.*?`", "  ", line)
+                        par[index] = INLINE_CODE.sub("  ", line)
                 modified_paragraphs[start_line] = par
     return modified_paragraphs
 
@@ -60,6 +60,7 @@ to the output, handles errors and checks for the correct encoding.
         self.__conv_profile = ConversionProfile.Blind
         self.__output_format = OutputFormat.Html
         self.__root_path = root_path
+        self.__jobs = None
 
     def get_formatter_for_format(self, format_):
         """Get converter object."""
@@ -121,7 +122,7 @@ to the output, handles errors and checks for the correct encoding.
         converter.set_meta_data(self.__meta_data)
         converter.setup()
         converter.set_profile(self.__conv_profile)
-        converter.convert(files, path=self.__root_path)
+        converter.convert(files, path=self.__root_path, jobs=self.__jobs)
 
     def set_conversion_profile(self, profile):
         if not isinstance(profile, ConversionProfile):
@@ -132,3 +133,10 @@ to the output, handles errors and checks for the correct encoding.
         if not isinstance(format_, OutputFormat):
             raise TypeError("Expected format of type " + type(OutputFormat))
         self.__output_format = format_
+
+    def set_jobs(self, jobs):
+        """Set the number of documents to convert concurrently; None lets the
+        converter decide."""
+        if jobs is not None and (not isinstance(jobs, int) or jobs < 1):
+            raise ValueError("Expected a positive number of jobs, got %s" % jobs)
+        self.__jobs = jobs
@@ -184,9 +184,7 @@ def __handle_gladtex_error(error, file_path, dirname):
     if details and "Number" in details and "Message" in details:
         number = int(details["Number"])
         with open(file_path, "r", encoding="utf-8") as file:
-            paragraphs = mparser.rm_codeblocks(
-                mparser.file2paragraphs(file.read().split("\n"))
-            )
+            paragraphs = mparser.rm_codeblocks(mparser.file2paragraphs(file))
             formulas = mparser.parse_formulas(paragraphs)
         try:
             pos = list(formulas.keys())[number - 1]
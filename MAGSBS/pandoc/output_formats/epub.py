@@ -136,7 +136,8 @@ class EpubConverter(OutputGenerator):
         if not isinstance(err, errors.MathError):
             raise err
         # recover line and pos of formula
-        eqns = mparser.parse_formulas(mparser.file2paragraphs(open(file_name)))
+        with open(file_name, encoding="utf-8") as f:
+            eqns = mparser.parse_formulas(mparser.file2paragraphs(f))
         line, pos = list(eqns.keys())[err.formula_count - 1]
         err.line = line
         err.pos = pos
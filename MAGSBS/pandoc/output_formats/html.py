@@ -4,6 +4,8 @@
 # details.
 #
 # (c) 2017-2018 Sebastian Humenda <shumenda |at| gmx |dot| de>
+from concurrent.futures import ThreadPoolExecutor
+import collections
 import json
 import os
 import shutil
@@ -171,20 +173,54 @@ class HtmlConverter(OutputGenerator):
         self.setup()
 
     def convert(self, files, **kwargs):
-        """See super class documentation."""
+        """See super class documentation. The keyword argument `jobs` sets the
+        number of directories converted concurrently, it defaults to the number
+        of processors. Files within one directory are converted one after
+        another, because they share the cache of converted formulas. The
+        configuration of each directory is looked up before the conversion
+        starts, since the ConfFactory is not thread-safe."""
         from ..converter import Pandoc
 
         cache, files = Pandoc.get_cache(files)
+        directories = collections.OrderedDict()
+        for file_name in files:
+            directories.setdefault(os.path.dirname(file_name), []).append(file_name)
         try:
-            for file_name in files:
-                self.__convert_document(file_name, cache)
-        except errors.MAGSBS_error as err:
-            if not err.path:
-                err.path = file_name
-            raise err
+            if not directories:
+                return
+            confs = {
+                dirname: config.ConfFactory().get_conf_instance(dirname)
+                for dirname in directories
+            }
+            jobs = kwargs.get("jobs") or os.cpu_count() or 1
+            with ThreadPoolExecutor(max_workers=min(jobs, len(directories))) as pool:
+                futures = [
+                    pool.submit(
+                        self.__convert_documents, file_names, cache, confs[dirname]
+                    )
+                    for dirname, file_names in directories.items()
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
         finally:
             self.cleanup()
 
+    def __convert_documents(self, file_names, file_cache, conf):
+        """Convert the given documents of one directory sequentially, using the
+        configuration `conf` of that directory."""
+        for file_name in file_names:
+            try:
+                self.__convert_document(file_name, file_cache, conf)
+            except errors.MAGSBS_error as err:
+                if not err.path:
+                    err.path = file_name
+                raise err
+
     @staticmethod
     def __handle_error(file_name, err):
         # set path for error
@@ -195,18 +231,20 @@ class HtmlConverter(OutputGenerator):
         if not isinstance(err, errors.MathError):
             raise err
         # recover line and pos of formula
-        eqns = mparser.parse_formulas(mparser.file2paragraphs(open(file_name)))
+        with open(file_name, encoding="utf-8") as f:
+            eqns = mparser.parse_formulas(mparser.file2paragraphs(f))
         line, pos = list(eqns.keys())[err.formula_count - 1]
         err.line = line
         err.pos = pos
         raise err from None  # no TB here
 
     # pylint: disable=too-many-locals
-    def __convert_document(self, path, file_cache):
+    def __convert_document(self, path, file_cache, conf):
         """Convert a document by a given path. It takes a converter which takes
         actual care of the underlying format. The filecache caches the list of
         files in the lecture. The list of files within a lecture is required to
-        build navigation links.
+        build navigation links. `conf` is the configuration of the directory of
+        the document.
         This function also inserts a page navigation bar to navigate between
         chapters and the table of contents."""
         # only convert if output file is newer than input file
@@ -224,6 +262,7 @@ class HtmlConverter(OutputGenerator):
                     mparser.extract_page_numbers_from_par(
                         mparser.file2paragraphs(document)
                     ),
+                    conf=conf,
                 )
             except errors.FormattingError as e:
                 e.path = path
@@ -242,7 +281,6 @@ class HtmlConverter(OutputGenerator):
         try:
             from ...config import MetaInfo
 
-            conf = config.ConfFactory().get_conf_instance(dirname)
             if conf[MetaInfo.AutoNumberingOfChapter]:
                 pandoc_args += [
                     "--number-sections",
@@ -305,7 +343,8 @@ class HtmlConverter(OutputGenerator):
         Generate the page navigation for a page. The file path must be relative to
         the lecture root. The file cache must be the datastructures.FileCache, the
         page numbers must have the format of mparser.extract_page_numbers_from.
-        `conf=` should not be used, it is intended for testing purposes.
+        `conf=` is the configuration of the directory of the file, it is looked
+        up if omitted.
         Returned is a tuple with the start and the end navigation bar. The
         navigation bar itself is a string."""
         if not os.path.exists(file_path):
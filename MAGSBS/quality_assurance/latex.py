@@ -56,14 +56,15 @@ class LaTeXMatricesShouldBeConstructeedUsingPmatrix(FormulaMistake):
 
 
 class LaTeXMatricesShouldHaveLineBreaks(FormulaMistake):
+    PATTERN = re.compile(r"\\begin{.*?matrix}.*\\\\.*&")
+
     def __init__(self):
         super().__init__()
         self.set_file_types(["md", "tex"])
-        self.pattern = re.compile(r"\\begin{.*?matrix}.*\\\\.*&")
 
     def worker(self, *args):
         for (line, pos), formula in args[0].items():
-            if self.pattern.search(formula):
+            if self.PATTERN.search(formula):
                 return self.error(
                     _(
                         "Each line of a matrix or table should "
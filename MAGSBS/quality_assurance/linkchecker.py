@@ -360,7 +360,7 @@ class LinkChecker:
         if links are pointing to the same files.
         """
         with open(path, encoding="utf-8") as file:
-            paragraphs = mparser.file2paragraphs(file.read())
+            paragraphs = mparser.file2paragraphs(file)
         self.__cached_headings[path] = mparser.extract_headings_from_par(paragraphs)
 
     def load_ids(self, path):
@@ -16,15 +16,14 @@ MetaInfo = config.MetaInfo
 class PageNumberIsParagraph(Mistake):
     """Check whether all page numbers are on a paragraph on their own."""
 
+    PATTERN = re.compile(r"^\|\|\s*" + config.PAGENUMBERING_PATTERN.pattern, re.VERBOSE)
+
     def __init__(self):
         super().__init__()
         self._error_text = _(
             "Each line number has to have an empty line "
             "before and after it, that is, on a paragraph of its own."
         )
-        self.pattern = re.compile(
-            r"^\|\|\s*" + config.PAGENUMBERING_PATTERN.pattern, re.VERBOSE
-        )
 
     def error(self, lnum):
         return super().error(self._error_text, lnum)
@@ -35,7 +34,7 @@ class PageNumberIsParagraph(Mistake):
                 continue  # that's either a correct one or not interesting
             for num, line in enumerate(paragraph):
                 # more than one line and a page number, bug
-                result = self.pattern.search(line.lower())
+                result = self.PATTERN.search(line.lower())
                 if result and None not in result.groups():
                     return self.error(start_line + num)
 
@@ -72,24 +71,21 @@ class ItemizeIsParagraph(Mistake):
     check whether first and last line are valid, else return error."""
 
     mistake_type = MistakeType.full_file
-
-    def __init__(self):
-        super().__init__()
-        self._itemize_pattern = re.compile(
-            r"""^\s*  # tolerate any whitespace in front
-            (-|\+|\* # any itemize character
-             |\(?(\d+|[iIvVlLxXcC]+)\) # understand any arabic/roman number enclosed or terminated by parenthesis
-             |(\d+|[iIvVlLxXcC]+)\.)
-            \s+ # at least one space required after item
-            """,
-            re.VERBOSE,
-        )
+    ITEMIZE_PATTERN = re.compile(
+        r"""^\s*  # tolerate any whitespace in front
+        (-|\+|\* # any itemize character
+         |\(?(\d+|[iIvVlLxXcC]+)\) # understand any arabic/roman number enclosed or terminated by parenthesis
+         |(\d+|[iIvVlLxXcC]+)\.)
+        \s+ # at least one space required after item
+        """,
+        re.VERBOSE,
+    )
 
     def worker(self, *args):
         """Only mark this as an error, when more than two itemize signs have
         been found at the beginning of a line, so that e.g. a dash which is ust
         in a text is not recognized as an itemize environment."""
-        is_item = lambda line: bool(self._itemize_pattern.search(line))
+        is_item = lambda line: bool(self.ITEMIZE_PATTERN.search(line))
         for start_line, paragraph in args[0].items():
             if not paragraph:
                 continue
@@ -138,10 +134,7 @@ indexing of page numbers."""
 
 class UniformPagestrings(Mistake):
     mistake_type = MistakeType.pagenumbers_dir
-
-    def __init__(self):
-        Mistake.__init__(self)
-        self.pattern = re.compile(".*(%s).*" % "|".join(config.PAGENUMBERINGTOKENS))
+    PATTERN = re.compile(".*(%s).*" % "|".join(config.PAGENUMBERINGTOKENS))
 
     def _error(self, first_fn, first_pnum, later_fn, later_pnum):
         first_fn = os.path.basename(first_fn)
@@ -168,7 +161,7 @@ class UniformPagestrings(Mistake):
         first = ()  # (fn, first page number)
         for fn, page_numbers in args[0].items():
             for pnum in page_numbers:
-                match = self.pattern.search(pnum.identifier.lower())
+                match = self.PATTERN.search(pnum.identifier.lower())
                 if not match:
                     continue
                 match = match.groups()
@@ -257,18 +250,16 @@ class PageNumbersWithoutDashes(Mistake):
 "|| page 8"."""
 
     mistake_type = MistakeType.full_file
-
-    def __init__(self):
-        super().__init__()
-        pattern = r"\|\|\s*(?:-)?\s*(" + "|".join(config.PAGENUMBERINGTOKENS) + ")"
-        self.pattern = re.compile(pattern.lower())
+    PATTERN = re.compile(
+        (r"\|\|\s*(?:-)?\s*(" + "|".join(config.PAGENUMBERINGTOKENS) + ")").lower()
+    )
 
     def worker(self, *args):
         for num, par in args[0].items():
             if len(par) > 1:
                 continue
             first_ln = par[0].lstrip().rstrip()
-            if self.pattern.search(first_ln.lower()):
+            if self.PATTERN.search(first_ln.lower()):
                 first_ln = first_ln[2:].lstrip()
                 # if all spaces and |'s are stripped, last character and first char must be dashes
                 if not first_ln.startswith("-") or not first_ln.endswith("-"):
@@ -284,12 +275,10 @@ class PageNumbersWithoutDashes(Mistake):
 class DoNotEmbedHtml(OnelinerMistake):
     """Do not use HTML. Especially, don't use <br/>."""
 
-    def __init__(self):
-        super().__init__()
-        self.pattern = re.compile(r'</?(\w+)\s*/?(:?\s+\w+=["\']\w+["\'])*\s*>')
+    PATTERN = re.compile(r'</?(\w+)\s*/?(:?\s+\w+=["\']\w+["\'])*\s*>')
 
     def check(self, num, line):
-        match = self.pattern.search(line.lower())
+        match = self.PATTERN.search(line.lower())
         tag = match.groups()[0] if match else None
         if tag and tag not in ["div", "span"]:
             pos_on_line = match.span()[1]
@@ -316,12 +305,10 @@ class DoNotEmbedHtml(OnelinerMistake):
 class EmbeddedHTMLComperators(OnelinerMistake):
     """Instead of &lt;&gt;, use \\< \\>."""
 
-    def __init__(self):
-        super().__init__()
-        self.pattern = re.compile(r"&(lt|gt);")
+    PATTERN = re.compile(r"&(lt|gt);")
 
     def check(self, num, line):
-        matched = self.pattern.search(line.lower())
+        matched = self.PATTERN.search(line.lower())
         if matched:
             return self.error(
                 _(
@@ -409,34 +396,29 @@ This will lead to Pandoc identifying these as sublists.
 """
 
     mistake_type = MistakeType.full_file
-
-    def __init__(self):
-        super().__init__()
-        # match "- 1." or "* +" or "- +" or "1. -"
-        self._pattern = re.compile(
-            r"""^\s*(?:-|\+|\*|\d+\.)\s+
-            # prohibit matching a horizontal rule (* * * or - - -) and bold / slanted text and also not european-style dates
-            (?![\*-]\s[\*-]| # horizontal rule
-                \*\*|\*\*?[a-z|A-Z]| # bold or slanted text
-                \d+\.[0-9a-zA-z]) # european-style dates dd.mm.YYYY
-                (.*)$""",
-            re.VERBOSE,
-        )
+    # match "- 1." or "* +" or "- +" or "1. -"
+    PATTERN = re.compile(
+        r"""^\s*(?:-|\+|\*|\d+\.)\s+
+        # prohibit matching a horizontal rule (* * * or - - -) and bold / slanted text and also not european-style dates
+        (?![\*-]\s[\*-]| # horizontal rule
+            \*\*|\*\*?[a-z|A-Z]| # bold or slanted text
+            \d+\.[0-9a-zA-z]) # european-style dates dd.mm.YYYY
+            (.*)$""",
+        re.VERBOSE,
+    )
+    # only match enumerations, not (German) dates like "2016."
+    IS_ENUM_ITEM = re.compile(r"^\d{1,2}\.")
 
     def worker(self, *args):
-        is_enum_item = re.compile(
-            r"^\d{1,2}\."
-        )  # only match enumerations, not (German) dates like "2016."
-
         for start_line, paragraph in args[0].items():
             enumeration_signs = 0
             errorneous_line = 0
             for rel_lnum, line in enumerate(paragraph):
-                match = self._pattern.search(line)
+                match = self.PATTERN.search(line)
                 if match and match.groups()[0]:  # didn't match the empty string
                     enumeration_signs += 1
                     text = match.groups()[0]
-                    if text[0] in ["-", "+"] or is_enum_item.search(text):
+                    if text[0] in ["-", "+"] or self.IS_ENUM_ITEM.search(text):
                         errorneous_line = start_line + rel_lnum
                         if enumeration_signs >= 2:  # it's a proper enumeration
                             break  # an error case was encountered
@@ -456,19 +438,17 @@ This will lead to Pandoc identifying these as sublists.
 class ToDosInImageDescriptionsAreBad(OnelinerMistake):
     """Some people tend to leave "to do" or similar in their material to mark areas as being not completed yet."""
 
-    def __init__(self):
-        super().__init__()
-        self._todo_pattern = re.compile(
-            r"""
-                ((?:to|To|TO)\s*(?:do|Do|DO))\s*
-                # expect punctuation, etc. to not match false positives
-                (?:\.|,|:|$)
-                """,
-            re.VERBOSE,
-        )
+    TODO_PATTERN = re.compile(
+        r"""
+            ((?:to|To|TO)\s*(?:do|Do|DO))\s*
+            # expect punctuation, etc. to not match false positives
+            (?:\.|,|:|$)
+            """,
+        re.VERBOSE,
+    )
 
     def check(self, lnum, line):
-        match = self._todo_pattern.search(line)
+        match = self.TODO_PATTERN.search(line)
         if match:
             return self.error(
                 _(
@@ -480,22 +460,20 @@ class ToDosInImageDescriptionsAreBad(OnelinerMistake):
 
 
 class BrokenImageLinksAreDetected(OnelinerMistake):
-    def __init__(self):
-        super().__init__()
-        # phrase is everything except ()[]; inserted into {0} below for easier readability
-        self._pattern = re.compile(
-            r"""^\s*
-            (\![^[]+?\]\([^)]+\) # image link where [ has been forgotten
-             |\!\[[^]]+\([^)]+\) # image link where ] has been forgotten
-             |\!\[[^]]+\][^(]+?\) # image link where ( has been forgotten
-             |\[[^]]+\]\s*\([^)]+?\.(?:jpg|png|tif|gif|svg)\) # image link where ! has been forgotten
-             |\!\[[^]]+?\]\([^)]+$) # image link where ) has been forgotten
-            """,
-            re.VERBOSE,
-        )
+    # phrase is everything except ()[]; inserted into {0} below for easier readability
+    PATTERN = re.compile(
+        r"""^\s*
+        (\![^[]+?\]\([^)]+\) # image link where [ has been forgotten
+         |\!\[[^]]+\([^)]+\) # image link where ] has been forgotten
+         |\!\[[^]]+\][^(]+?\) # image link where ( has been forgotten
+         |\[[^]]+\]\s*\([^)]+?\.(?:jpg|png|tif|gif|svg)\) # image link where ! has been forgotten
+         |\!\[[^]]+?\]\([^)]+$) # image link where ) has been forgotten
+        """,
+        re.VERBOSE,
+    )
 
     def check(self, num, line):
-        if self._pattern.search(line.lower()):
+        if self.PATTERN.search(line.lower()):
             # check whether ! [ ] ( ) are all in the line, if so, it's a false positive
             for punct in ["(", ")", "[", "]", "!"]:
                 if not punct in line:
@@ -130,7 +130,7 @@ class Mistkerl:
                 try:
                     with open(file_path, encoding="utf-8") as f:
                         paragraphs = mparser.rm_codeblocks(
-                            mparser.file2paragraphs(f.read(), join_lines=True)
+                            mparser.file2paragraphs(f, join_lines=True)
                         )
                 except UnicodeDecodeError:
                     msg = _(
@@ -18,6 +18,40 @@ MetaInfo = config.MetaInfo
 # Alias
 HeadingType = datastructures.Heading.Type
 
+PREFACE_DIRECTORY = re.compile(r"^v\d\d")
+
+
+def parse_headings(path):
+    """Return a tuple with the headings of the given file and a flag whether
+    the file has been edited, i.e. contains more than its headings."""
+    with open(path, "r", encoding="utf-8") as cnt:
+        paragraphs = mparser.file2paragraphs(cnt)
+    headings = mparser.extract_headings(path, paragraphs)
+    return (headings, _is_edited(paragraphs, headings))
+
+
+def _is_edited(paragraphs, headings):
+    """Check whether any text apart from the headings has been inserted."""
+    heading_lines = [h.get_line_number() for h in headings]
+    all_lines_are_headings = lambda x: all(l.startswith("#") for l in x)
+    for start_line, lines in paragraphs.items():
+        if len(lines) > 2:
+            # is it an actual heading:
+            if not all_lines_are_headings(lines):
+                return True
+        elif len(lines) == 2:
+            # only paragraphs with underlined headings or two ##-headings
+            # are accepted:
+            if not all_lines_are_headings(lines) and not (
+                ("----" in lines[1] or "====" in lines[1])
+                and start_line in heading_lines
+            ):
+                return True  # modification detected, was edited
+        else:  # paragraph with exactly one line
+            if not start_line in heading_lines:
+                return True
+    return False
+
 
 class HeadingIndexer:
     """Walk the file system tree from "dir" and have a look in all files which end on
@@ -49,7 +83,7 @@ By calling the function, the actual index is build."""
                     for heading in headings:  # reference
                         heading.set_type(datastructures.Heading.Type.APPENDIX)
                 # preface headings
-                elif re.search(r"^v\d\d", os.path.split(directory)[-1]):
+                elif PREFACE_DIRECTORY.search(os.path.split(directory)[-1]):
                     for heading in headings:  # reference
                         heading.set_type(datastructures.Heading.Type.PREFACE)
 
@@ -59,30 +93,9 @@ By calling the function, the actual index is build."""
     def __retrieve_headings_from(self, path):
         """Retrieve headings from path and annotate them with 'unedited' if the
         file was not edited yet."""
-        with open(path, "r", encoding="utf-8") as cnt:
-            paragraphs = mparser.file2paragraphs(cnt.read())
-        headings = mparser.extract_headings(path, paragraphs)
-        heading_lines = [h.get_line_number() for h in headings]
-
-        all_lines_are_headings = lambda x: all(l.startswith("#") for l in x)
-        # check whether any text has been inserted and if not; if so, return
-        # unmodified heading list
-        for start_line, lines in paragraphs.items():
-            if len(lines) > 2:
-                # is it an actual heading:
-                if not all_lines_are_headings(lines):
-                    return headings
-            elif len(lines) == 2:
-                # only paragraphs with underlined headings or two ##-headings
-                # are accepted:
-                if not all_lines_are_headings(lines) and not (
-                    ("----" in lines[1] or "====" in lines[1])
-                    and start_line in heading_lines
-                ):
-                    return headings  # modification detected, was edited
-            else:  # paragraph with exactly one line
-                if not start_line in heading_lines:
-                    return headings
+        headings, edited = parse_headings(path)
+        if edited:
+            return headings
 
         #  at this point, no modifications found, construct new headings
         conf = config.ConfFactory().get_conf_instance(path)
@@ -98,10 +111,8 @@ By calling the function, the actual index is build."""
         return headings
 
     def get_index(self):
-        tmp = collections.OrderedDict()
-        for key in sorted(self.__index):
-            tmp[key] = self.__index[key]
-        return tmp
+        # file paths are unique, so the headings are never compared
+        return collections.OrderedDict(sorted(self.__index.items()))
 
 
 class ChapterNumberEnumerator:
@@ -198,12 +209,13 @@ the TOC corrrectly."""
             HeadingType.PREFACE: ChapterNumberEnumerator(),
         }
 
+        toc_depth = self.conf[MetaInfo.TocDepth]
         for path, headings in self.__index.items():
             path, file = os.path.split(path)
             # necessary for relative link
             directory_above = os.path.split(path)[-1]
             for heading in headings:
-                if heading.get_level() > self.conf[MetaInfo.TocDepth]:
+                if heading.get_level() > toc_depth:
                     continue  # skip headings above configured threshold
                 h_type = heading.get_type()
                 if not isinstance(h_type, HeadingType):
@@ -232,66 +244,75 @@ the TOC corrrectly."""
 
     def format(self):
         """Format all headings into a markdown page."""
+        return "".join(self.iter_format())
+
+    def iter_format(self):
+        """Format all headings into a markdown page, yielding it chunk by chunk.
+        The chunks can be passed directly to `file.writelines()`, so that the
+        table of contents does not need to be assembled in memory."""
         if self.conf[MetaInfo.GenerateToc] == 0:
-            return ""
+            return
         l10n = config.Translate()
         l10n.set_language(self.conf[MetaInfo.Language])
         _ = l10n.get_translation
         title = (
             _("table of contents").title() + " - " + self.conf[MetaInfo.LectureTitle]
         )
-        output = ["%s\n" % title, "=" * len(title), "\n\n"]
+        yield "%s\n" % title
+        yield "=" * len(title)
+        yield "\n\n"
 
-        def add_entry(file_name, toc_entry):
+        def entry(file_name, toc_entry):
             if os.path.exists(file_name) or os.path.exists(file_name.lower()):
-                output.append(toc_entry)
+                return [toc_entry]
+            return []
 
         # if manual title page exists, link to it
-        add_entry(
+        yield from entry(
             "titel.md",
             "[%s](titel.%s\n\n" % (_("title page").title(), self.__file_extension),
         )
 
         if self.__headings[HeadingType.PREFACE]:
-            output += self.format_section(
+            yield from self.format_section(
                 _("preface").title(), self.__headings[HeadingType.PREFACE]
             )
 
         # include section title "chapters" if a preface exists
-        output += self.format_section(
+        yield from self.format_section(
             _("chapters").title() if self.__headings[HeadingType.PREFACE] else None,
             self.__headings[HeadingType.NORMAL],
         )
         if self.__headings[HeadingType.APPENDIX]:
             title = None if self.__appendix_prefix else _("appendix").title()
-            output += self.format_section(title, self.__headings[HeadingType.APPENDIX])
-        output.append("\n\n")
+            yield from self.format_section(title, self.__headings[HeadingType.APPENDIX])
 
-        add_entry(
+        trailer = ["\n\n"]
+        trailer += entry(
             "taktil.md",
             "[{}](taktil.{})\\\n".format(
                 _("list of tactile graphics").capitalize(), self.__file_extension,
             ),
         )
-        add_entry(
+        trailer += entry(
             "copyright.md",
             "[{}](copyright.{})\\\n".format(
                 _("copyright notice").capitalize(), self.__file_extension
             ),
         )
-
-        if output[-1].endswith("\\\n"):  # strip \\ from last line
-            output[-1] = output[-1][:-2] + "\n"
+        if trailer[-1].endswith("\\\n"):  # strip \\ from last line
+            trailer[-1] = trailer[-1][:-2] + "\n"
+        yield from trailer
 
         # include info.md, if it exists
-        add_entry(
+        yield from entry(
             "info.md",
             ("\n\n* * * * *\n\n[{}](info.{})\n").format(
                 _("remarks about the accessible version").capitalize(),
                 self.__file_extension,
             ),
         )
-        return "".join(output) + "\n"
+        yield "\n"
 
     def format_section(self, title, headings):
         """Format a section of the table of contents. Sections are i.e. appendix
@@ -300,12 +321,13 @@ the TOC corrrectly."""
         chunks = []
         if title:
             chunks = [title, "\n", "-" * len(title), "\n\n"]
-        for index, (chapter_number, heading, path) in enumerate(headings):
-            chunks.append(
-                "\n%s" % self.__heading2toclink(chapter_number, heading, path)
+        # all but the last link end on a line continuation
+        chunks.append(
+            "\\".join(
+                "\n" + self.__heading2toclink(chapter_number, heading, path)
+                for chapter_number, heading, path in headings
             )
-            if index != len(headings) - 1:
-                chunks.append("\\")
+        )
         chunks.append("\n\n")
         return chunks
 
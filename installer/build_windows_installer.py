@@ -10,32 +10,43 @@ Dependencies:
 * nsis (Nullsoft Installer)
 * python >= 3.4
 * pandocfilters
-* 7z or unzip (command-line programs)
 If running from Windows: haskell-platform
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import os, os.path as path
+import re
 import shutil
 import subprocess
 import sys
+import urllib.request
+import zipfile
 
 sys.path.insert(0, os.path.abspath(".."))  # insert directory above as first path
 
 PANDOC_INSTALLER_URL = "https://github.com/jgm/pandoc/releases/download/2.9.1.1/pandoc-2.9.1.1-windows-x86_64.zip"
 
 BUILD_DIRECTORY = "build"
+# files to be installed; the build directory itself holds the nsis script
+BINARY_DIRECTORY = os.path.join(BUILD_DIRECTORY, "binary")
+
+# chunk size for copying downloads to disk
+DOWNLOAD_BUFFER_SIZE = 256 * 1024
+# definitions in the nsis script which are set by update_installer_info
+INSTALLER_DEFINE = re.compile(
+    r"!define (VERSIONMAJOR|VERSIONMINOR|VERSIONBUILD|INSTALLSIZE)\b"
+)
+# downloads are kept here across builds; the URLs contain the version number,
+# so a file name identifies its content
+DOWNLOAD_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "matuc-installer")
 
 
 def subprocess_call(cmd, other_dir=None):
-    cwd = os.getcwd()
-    if other_dir:
-        os.chdir(other_dir)
-    ret = os.system(cmd)
-    if ret:
-        print("Subprocess halted, command:", cmd)
+    """Run the command, given as list of arguments, optionally in another
+    directory. Exit if it fails."""
+    if subprocess.run(cmd, cwd=other_dir).returncode:
+        print("Subprocess halted, command:", " ".join(cmd))
         sys.exit(127)
-    if other_dir:
-        os.chdir(cwd)
 
 
 class SetUp:
@@ -69,7 +80,10 @@ class SetUp:
         """Check whether a library exists."""
         command_prefix = "wine " if self.needs_wine else ""
         module_found = (
-            os.system('%s -c "import %s"' % (self.python_command, module)) == 0
+            subprocess.run(
+                self.python_command.split(" ") + ["-c", "import %s" % module]
+            ).returncode
+            == 0
         )
         if not module_found:
             print(
@@ -84,7 +98,9 @@ class SetUp:
                 "wine", "wine64", "Install it from https://www.winehq.org/download",
             )
             # detect python; -h switch is used to notprint output
-            if os.system("wine python -h 2>&1 > /dev/null"):
+            if subprocess.run(
+                ["wine", "python", "-h"], stdout=subprocess.DEVNULL
+            ).returncode:
                 # if command python3 not found, try python
                 print(
                     "Python not installed, install it in wine using ?`wine msiexec /i <msi-name>`"
@@ -94,25 +110,23 @@ class SetUp:
                 "python", "python3", "Install it from https://www.winehq.org/download",
             )
 
-        import re
-
-        # detect python version
-        proc = subprocess.Popen(
-            self.python_command.split(" ") + ["--version"], stdout=subprocess.PIPE,
-        )
-        data = proc.communicate()[0].decode(sys.getdefaultencoding())
-        if proc.wait():
-            print("error while retrieving python version: ", repr(data))
-            sys.exit(3)
-        pyversion = re.search(r".*ython.*\s+(3\.\d+).*", data)
-        if pyversion:
-            pyversion = pyversion.groups()[0]
-            if not pyversion.startswith("3"):
-                print(
-                    "Python version >= 3.2 required, found %s" % pyversion.groups()[0]
-                )
+        # detect python version; without wine, the build uses this interpreter
+        if self.needs_wine:
+            proc = subprocess.Popen(
+                self.python_command.split(" ") + ["--version"], stdout=subprocess.PIPE
+            )
+            data = proc.communicate()[0].decode(sys.getdefaultencoding())
+            if proc.wait():
+                print("error while retrieving python version: ", repr(data))
+                sys.exit(3)
+            pyversion = re.search(r"ython\s+(\d+)\.(\d+)", data)
+            pyversion = tuple(map(int, pyversion.groups())) if pyversion else None
         else:
+            pyversion = sys.version_info[:2]
+        if not pyversion:
             print("Python version >= 3.2 required.")
+        elif pyversion < (3, 2):
+            print("Python version >= 3.2 required, found %d.%d" % pyversion)
 
         # test for pyinstaller
         self.check_for_command(
@@ -125,33 +139,38 @@ class SetUp:
             "nsis",
             "Please install it from http://nsis.sourceforge.net/Download.",
         )
-        self.check_for_command(
-            "7z", "p7zip-full", "Please install it from http://7-zip.org"
-        )
 
     def retrieve_dependencies(self):
         """Check whether all dependencies have been installed and downloaded."""
-        # pylint: disable=unused-variable,multiple-imports
-        # fetch gladtex
-        os.mkdir(BUILD_DIRECTORY)
-        import io, urllib.request, zipfile
-
+        os.makedirs(BINARY_DIRECTORY, exist_ok=True)
         # fetch pandoc installer, extract pandoc.exe (is a static binary)
-        tmp = os.path.join(BUILD_DIRECTORY, "tmp.pandoc")
-        os.mkdir(tmp)
-        print("Downloading", PANDOC_INSTALLER_URL)
-        with urllib.request.urlopen(PANDOC_INSTALLER_URL) as u:
-            with open(os.path.join(tmp, "x.zip"), "wb") as f:
-                f.write(u.read())
-        os.chdir(tmp)
-        if not shutil.which("7z"):
-            subprocess_call("7z x x.zip")
-        else:
-            subprocess_call("7z x x.zip")
-        os.rename(os.path.join(".", "pandoc.exe"), os.path.join("..", "pandoc.exe"))
-        os.chdir("..")
-        shutil.rmtree(os.path.basename(tmp))  # remove pandoc's temp directory
-        os.chdir("..")
+        with zipfile.ZipFile(download(PANDOC_INSTALLER_URL)) as archive:
+            # the binary is contained in a versioned directory
+            pandoc = next(
+                n for n in archive.namelist() if n.split("/")[-1] == "pandoc.exe"
+            )
+            with archive.open(pandoc) as src, open(
+                os.path.join(BINARY_DIRECTORY, "pandoc.exe"), "wb"
+            ) as dst:
+                shutil.copyfileobj(src, dst, DOWNLOAD_BUFFER_SIZE)
+
+
+def download(url):
+    """Download the given URL into the download cache, unless already present.
+    Return the path of the cached file."""
+    os.makedirs(DOWNLOAD_CACHE, exist_ok=True)
+    cached = os.path.join(DOWNLOAD_CACHE, url.rsplit("/", 1)[-1])
+    if os.path.exists(cached):
+        print("Using cached", cached)
+        return cached
+    print("Downloading", url)
+    # download to a temporary name, an aborted download must not be cached
+    with urllib.request.urlopen(url) as u:
+        with open(cached + ".part", "wb", buffering=DOWNLOAD_BUFFER_SIZE) as f:
+            # don't hold the whole zip in memory
+            shutil.copyfileobj(u, f, DOWNLOAD_BUFFER_SIZE)
+    os.replace(cached + ".part", cached)
+    return cached
 
 
 def clean():
@@ -170,9 +189,14 @@ def get_size(directory):
     """Return the size of a directory by recursively querying the size of all
     files in it."""
     size = 0
-    for path, _, files in os.walk(directory):
-        for file in files:
-            size += os.path.getsize(os.path.join(path, file))
+    directories = [directory]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                else:
+                    size += entry.stat(follow_symlinks=False).st_size
     return size / 1024  # bytes -> kB
 
 
@@ -180,22 +204,22 @@ def update_installer_info(filename, version, total_size_kb):
     """Update fields in the installer nsi script like size and version
     number."""
     vlist = tuple(version.version)
+    values = {
+        "VERSIONMAJOR": vlist[0],
+        "VERSIONMINOR": vlist[1],
+        "VERSIONBUILD": vlist[2],
+        "INSTALLSIZE": total_size_kb,
+    }
     data = []
     with open(filename, encoding="utf-8") as file:
         for line in file:
-            if "!define VERSIONMAJOR" in line:
-                line = "!define VERSIONMAJOR %d\n" % vlist[0]
-            elif "!define VERSIONMINOR" in line:
-                line = "!define VERSIONMINOR %d\n" % vlist[1]
-            elif "!define VERSIONBUILD" in line:
-                line = "!define VERSIONBUILD %d\n" % vlist[2]
-            elif "!define INSTALLSIZE" in line:
-                line = "!define INSTALLSIZE %d\n" % total_size_kb
+            match = INSTALLER_DEFINE.search(line)
+            if match:
+                line = "!define %s %d\n" % (match.group(1), values[match.group(1)])
             # else: keep line
             data.append(line)
     with open(filename, "w", encoding="utf-8") as file:
-        for line in data:
-            file.write(line)
+        file.write("".join(data))
 
 
 def compile_scripts(command, target):
@@ -207,9 +231,22 @@ def compile_scripts(command, target):
 
     for script in ["matuc.py", "matuc_js.py"]:
         subprocess_call(
-            f"pyinstaller --clean -d all MAGSBS{os.sep}{script} --onefile  --distpath installer{os.sep}{target} "
-            f"--paths {os.path.dirname(os.path.dirname(gleetex.__file__))} "
-            "--hidden-import=gleetex --additional-hooks-dir=.",
+            [
+                "pyinstaller",
+                "--clean",
+                os.path.join("MAGSBS", script),
+                "--onefile",
+                # UPX slows down the build and start-up of the executables
+                "--noupx",
+                "--exclude-module",
+                "tkinter",
+                "--distpath",
+                os.path.join("installer", target),
+                "--paths",
+                os.path.dirname(os.path.dirname(gleetex.__file__)),
+                "--hidden-import=gleetex",
+                "--additional-hooks-dir=.",
+            ],
             other_dir=path.abspath(".."),
         )
 
@@ -218,21 +255,22 @@ def build_installer():
     """Prepare environment to build Windows installer using makensis."""
     # move a few files like e.g. README to distribution; MAGSBS and matuc_impl are
     # required, since py2exe doesn't include them properly
-    target = lambda x: os.path.join(BUILD_DIRECTORY, x)
-    shutil.copytree(os.path.join("..", "MAGSBS"), target("MAGSBS"))
+    target = lambda x: os.path.join(BINARY_DIRECTORY, x)
+    shutil.copytree(
+        os.path.join("..", "MAGSBS"),
+        target("MAGSBS"),
+        # file times aren't needed in the installer, neither are byte-code caches
+        copy_function=shutil.copy,
+        ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+    )
     shutil.copyfile(os.path.join("..", "COPYING"), target("COPYING.txt"))
     shutil.copyfile(os.path.join("..", "README.md"), target("README.md"))
     # make text files readable for Windows users
-    os.chdir(BUILD_DIRECTORY)
-    if shutil.which("flip"):
-        os.system("flip -bm COPYING.txt")
-    os.chdir("..")
-
-    # move all files from BUILD_DIRECTORY to a subdirectory; this way a
-    # temporary .nsis-file can be used
-    os.rename(BUILD_DIRECTORY, "binary")
-    os.mkdir(BUILD_DIRECTORY)
-    os.rename("binary", os.path.join(BUILD_DIRECTORY, "binary"))
+    for text_file in ("COPYING.txt", "README.md"):
+        with open(target(text_file), "rb") as file:
+            data = file.read()
+        with open(target(text_file), "wb") as file:
+            file.write(data.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n"))
 
     # copy matuc.nsi and *.nsh to build/
     shutil.copy("EnvVarUpdate.nsh", os.path.join(BUILD_DIRECTORY, "EnvVarUpdate.nsh"))
@@ -250,19 +288,21 @@ def build_installer():
     if os.path.exists(out_file):
         os.remove(out_file)
 
-    subprocess_call("makensis matuc.nsi", other_dir=BUILD_DIRECTORY)
+    subprocess_call(["makensis", "matuc.nsi"], other_dir=BUILD_DIRECTORY)
 
     os.rename(os.path.join(BUILD_DIRECTORY, "matuc-installer.exe"), out_file)
-    if shutil.which("chmod"):
-        os.system("chmod a+r " + out_file)
+    os.chmod(out_file, os.stat(out_file).st_mode | 0o444)  # a+r
 
 
 def main():
     clean()  # clean up previous build files
     st = SetUp()
     st.detect_build_dependencies()
-    st.retrieve_dependencies()
-    compile_scripts(st.python_command, BUILD_DIRECTORY)
+    # Pandoc is downloaded while PyInstaller runs, neither needs the other
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        retrieval = pool.submit(st.retrieve_dependencies)
+        compile_scripts(st.python_command, BINARY_DIRECTORY)
+        retrieval.result()
     build_installer()
     clean()
 
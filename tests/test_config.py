@@ -53,6 +53,22 @@ class Testconf(unittest.TestCase):
                 "expected version number 20.2, got: " + repr(data),
             )
 
+    def test_that_subdirectory_without_configuration_uses_root_configuration(self):
+        os.mkdir("k01")
+        write(conf(config.CONF_FILE_NAME))
+        factory = config.ConfFactory()
+        root = factory.get_conf_instance(".")
+        self.assertIs(factory.get_conf_instance("k01"), root)
+
+    def test_that_configuration_lookup_for_subdirectory_is_cached(self):
+        os.mkdir("k01")
+        write(conf(config.CONF_FILE_NAME))
+        factory = config.ConfFactory()
+        first = factory.get_conf_instance("k01")
+        with patch("MAGSBS.common.is_lecture_root") as is_lecture_root:
+            self.assertIs(factory.get_conf_instance("k01"), first)
+            is_lecture_root.assert_not_called()
+
     def test_that_same_version_just_works_fine(self):
         c = conf("path", "0.9")
         write(c)
@@ -1,5 +1,49 @@
 # pylint: disable=too-many-public-methods,import-error,too-few-public-methods,missing-docstring,unused-variable
-import unittest, sys
+import os, shutil, sys, tempfile, unittest
 
 sys.path.insert(0, ".")  # just in case
 import MAGSBS.filesystem as fs
+
+
+def touch(path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n")
+
+
+class test_FileWalker(unittest.TestCase):
+    def setUp(self):
+        self.original_directory = os.getcwd()
+        self.tmpdir = tempfile.mkdtemp()
+        os.chdir(self.tmpdir)
+        for path in ("k01/k01.md", "k01/bilder.md", "k02/k02.md", "k02/foo.txt"):
+            touch(path)
+        touch("k01/bilder/k01.md")
+        touch("anh01/anh01.md")
+        touch("notes/k03.md")
+
+    def tearDown(self):
+        os.chdir(self.original_directory)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_that_walking_cwd_yields_relative_paths(self):
+        walked = fs.get_markdown_files(".")
+        self.assertEqual(walked[0], (".", ["anh01", "k01", "k02"], []))
+        self.assertEqual(
+            walked[1:],
+            [
+                ("anh01", [], ["anh01.md"]),
+                ("k01", [], ["k01.md"]),
+                ("k02", [], ["k02.md"]),
+            ],
+        )
+
+    def test_that_blacklisted_directories_and_other_endings_are_skipped(self):
+        walked = fs.get_markdown_files("k01", all_markdown_files=True)
+        self.assertEqual(walked, [("k01", [], ["bilder.md", "k01.md"])])
+        walked = fs.get_markdown_files("k02", all_markdown_files=True)
+        self.assertEqual(walked, [("k02", [], ["k02.md"])])
+
+    def test_that_non_chapter_directories_are_included_if_requested(self):
+        dirs = [d for d, _, _ in fs.get_markdown_files(".", all_markdown_files=True)]
+        self.assertIn("notes", dirs)
@@ -1,6 +1,8 @@
 # This file does NOT test pandoc, but MAGSBS.pandoc ;)
 # pylint: disable=too-many-public-methods,import-error,too-few-public-methods,missing-docstring,unused-variable,multiple-imports,invalid-name
-import os, shutil, tempfile, unittest, json, pandocfilters
+import os, shutil, tempfile, threading, unittest, json, pandocfilters
+from unittest.mock import patch
+import MAGSBS.config
 from MAGSBS.config import MetaInfo
 import MAGSBS.datastructures as datastructures
 import MAGSBS.errors as errors
@@ -149,6 +151,73 @@ class test_HTMLConverter(unittest.TestCase):
 ################################################################################
 
 
+class test_HTMLConverterJobs(unittest.TestCase):
+    """Test the distribution of directories over worker threads. The actual
+    Pandoc run is replaced, only the order and the grouping are recorded."""
+
+    FILES = (
+        os.path.join("k01", "k01.md"),
+        os.path.join("k01", "k0102.md"),
+        os.path.join("k02", "k02.md"),
+        os.path.join("k02", "k0202.md"),
+        os.path.join("k03", "k03.md"),
+    )
+
+    def setUp(self):
+        self.original_directory = os.getcwd()
+        self.tmpdir = tempfile.mkdtemp()
+        os.chdir(self.tmpdir)
+        for path in self.FILES:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("Heading\n=======\n")
+
+    def tearDown(self):
+        os.chdir(self.original_directory)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def convert(self, jobs):
+        """Convert all files and return a list of (thread name, path, conf)."""
+        calls = []
+        lock = threading.Lock()
+
+        def convert_document(_self, path, _file_cache, conf):
+            with lock:
+                calls.append((threading.current_thread().name, path, conf))
+
+        with patch.object(
+            pandoc.output_formats.html.HtmlConverter,
+            "_HtmlConverter__convert_document",
+            convert_document,
+        ):
+            get_html_converter().convert(list(self.FILES), jobs=jobs)
+        return calls
+
+    def test_that_one_job_converts_all_files_in_order_in_one_thread(self):
+        calls = self.convert(jobs=1)
+        self.assertEqual([path for _t, path, _c in calls], list(self.FILES))
+        self.assertEqual(len({thread for thread, _p, _c in calls}), 1)
+
+    def test_that_several_jobs_convert_each_directory_in_one_thread(self):
+        calls = self.convert(jobs=3)
+        self.assertEqual(sorted(p for _t, p, _c in calls), sorted(self.FILES))
+        for directory in ("k01", "k02", "k03"):
+            in_dir = [c for c in calls if os.path.dirname(c[1]) == directory]
+            # files of one directory keep their order and share a thread
+            self.assertEqual(
+                [path for _t, path, _c in in_dir],
+                [f for f in self.FILES if os.path.dirname(f) == directory],
+            )
+            self.assertEqual(len({thread for thread, _p, _c in in_dir}), 1)
+
+    def test_that_workers_receive_configuration_of_their_directory(self):
+        for _thread, path, conf in self.convert(jobs=3):
+            self.assertIs(
+                conf,
+                MAGSBS.config.ConfFactory().get_conf_instance(os.path.dirname(path)),
+            )
+
+
 class test_EPUBConverter(unittest.TestCase):
     def setUp(self):
         self.original_directory = os.getcwd()
@@ -1,4 +1,8 @@
 # pylint: disable=too-many-public-methods,import-error,too-few-public-methods,missing-docstring,unused-variable
+import collections
+import os
+import shutil
+import tempfile
 import unittest
 import MAGSBS.datastructures
 import MAGSBS.toc as toc
@@ -96,3 +100,60 @@ class test_factories(unittest.TestCase):
             c.register(has_no_level())  # heading with level set
         with self.assertRaises(ValueError):
             c.register(h("h1 without chapter", 99))
+
+
+class test_TocFormatter(unittest.TestCase):
+    def setUp(self):
+        self.original_directory = os.getcwd()
+        self.tmpdir = tempfile.mkdtemp()
+        os.chdir(self.tmpdir)
+        for name in ("copyright.md", "info.md"):
+            with open(name, "w", encoding="utf-8") as f:
+                f.write("\n")
+
+    def tearDown(self):
+        os.chdir(self.original_directory)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def get_formatter(self):
+        index = collections.OrderedDict()
+        index[os.path.join("k01", "k01.md")] = [h("intro", 1, 1), h("more", 2, 1)]
+        index[os.path.join("k02", "k02.md")] = [h("outro", 1, 2)]
+        return toc.TocFormatter(index, ".")
+
+    def test_that_streamed_chunks_form_table_of_contents(self):
+        self.assertEqual(
+            "".join(self.get_formatter().iter_format()),
+            "Inhaltsverzeichnis - Unknown\n"
+            "============================\n\n\n"
+            "[1 intro](k01/k01.html#intro)\\\n"
+            "[1.1 more](k01/k01.html#more)\\\n"
+            "[2 outro](k02/k02.html#outro)\n\n\n\n"
+            "[Hinweise zum urheberrecht](copyright.html)\n\n\n"
+            "* * * * *\n\n"
+            "[Hinweise zur barrierefreien version](info.html)\n\n",
+        )
+
+    def test_that_last_entry_before_info_has_no_line_continuation(self):
+        page = self.get_formatter().format()
+        self.assertIn("(copyright.html)\n", page)
+        self.assertNotIn("(copyright.html)\\", page)
+        self.assertTrue(page.rstrip().endswith("(info.html)"))
+
+    def test_that_file_with_only_headings_is_not_edited(self):
+        os.mkdir("k01")
+        path = os.path.join("k01", "k01.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Foo\n====\n")
+        headings, edited = toc.parse_headings(path)
+        self.assertEqual([x.get_text() for x in headings], ["Foo"])
+        self.assertFalse(edited)
+
+    def test_that_file_with_text_is_edited(self):
+        os.mkdir("k01")
+        path = os.path.join("k01", "k01.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Foo\n====\n\nsome text\n\nBar\n----\n")
+        headings, edited = toc.parse_headings(path)
+        self.assertEqual([x.get_text() for x in headings], ["Foo", "Bar"])
+        self.assertTrue(edited)